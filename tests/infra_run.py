@@ -1,5 +1,7 @@
 import json
+import time
 from vantage6.client import Client
+from vantage6.common.task_status import has_task_finished
 
 from getpass import getpass
 from pydantic import BaseModel, validator
@@ -40,24 +42,64 @@ config = Vantage6Config(
 )
 
 
-def run_task(algorithm_config):
-    # Initialize client and authenticate using our config object
-    client = Client(config.server_url, config.server_port, config.server_api)
-    client.authenticate(username=config.username, password=config.password)
-    if "organization_key" in config:
-        client.setup_encryption(config.organization_key)
+# Authenticated client shared by all tasks run from this process
+_client = None
+
+# Server metadata (organizations, collaborations) cached as key -> (fetch time, data)
+_meta_cache = {}
+
+
+def _get_client():
+    # Initialize client and authenticate using our config object, only once
+    global _client
+    if _client is None:
+        _client = Client(config.server_url, config.server_port, config.server_api)
+        _client.authenticate(username=config.username, password=config.password)
+        if "organization_key" in config:
+            _client.setup_encryption(config.organization_key)
+    return _client
+
+
+def _wait_for_tasks(client, task_ids, initial_delay=0.5, max_delay=15.0):
+    # Poll the status of all tasks with a shared exponential backoff, capped at max_delay seconds
+    pending = set(task_ids)
+    delay = initial_delay
+    while True:
+        pending = {
+            task_id for task_id in pending
+            if not has_task_finished(client.task.get(task_id).get("status"))
+        }
+        if not pending:
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+def _cached(key, fetch, ttl=60):
+    # Return the cached value for key if it is younger than ttl seconds, otherwise refetch it
+    now = time.monotonic()
+    cached = _meta_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    data = fetch()
+    _meta_cache[key] = (now, data)
+    return data
+
 
+def _check_server(client):
     # Retrieve organizations and perform an intermediary check
-    organizations_data = client.organization.list().get('data', [])
+    organizations_data = _cached("organizations", lambda: client.organization.list().get('data', []))
     organizations = {org['name']: org['id'] for org in organizations_data}
     if not organizations:
         raise RuntimeError("No organizations found!")
     
     # Retrieve collaborations and check if they exist
-    collaborations = client.collaboration.list().get('data', [])
+    collaborations = _cached("collaborations", lambda: client.collaboration.list().get('data', []))
     if not collaborations:
         raise RuntimeError("No collaborations found!")
-    
+
+
+def _create_task(client, algorithm_config):
     print(algorithm_config)
 
     # Create and run the task
@@ -73,10 +115,29 @@ def run_task(algorithm_config):
     
     task_id = task.get("id")
     print(task_id)
-    client.wait_for_results(task_id)
+    return task_id
+
+
+def run_task(algorithm_config):
+    client = _get_client()
+    _check_server(client)
+    task_id = _create_task(client, algorithm_config)
+    _wait_for_tasks(client, [task_id])
     results = client.result.get(task_id)
     return results
 
+
+def run_tasks(algorithm_configs):
+    # Submit all tasks back to back, then wait for them together
+    client = _get_client()
+    _check_server(client)
+    task_ids = [_create_task(client, algorithm_config) for algorithm_config in algorithm_configs]
+    _wait_for_tasks(client, task_ids)
+    return {
+        algorithm_config['name']: client.result.get(task_id)
+        for algorithm_config, task_id in zip(algorithm_configs, task_ids)
+    }
+
 if __name__ == "__main__":
     # Define algorithm-specific configurations as dictionaries.
     # km_config = {
@@ -125,7 +186,7 @@ if __name__ == "__main__":
         'databases': [{'label': 'default'}]
     }
 
-    # Run the tasks. You can choose to run one or both algorithms.
+    # Run the tasks. You can choose to run one or several algorithms (see run_tasks).
     results_stats = run_task(stats_config)
 
     # Instead of printing results directly, we collect them in a JSON dictionary.
@@ -1,5 +1,6 @@
 from vantage6.algorithm.tools.mock_client import MockAlgorithmClient
 from pprint import pprint
+import numpy as np
 import matplotlib.pyplot as plt
 
 
@@ -30,32 +31,26 @@ def plot_aggregated_lab_boxplots(agg_dict, safety_threshold=5):
     Returns:
       fig (matplotlib.figure.Figure): The generated figure containing the box plots.
     """
-    boxplot_data = []
-    labels = []
-    
-    for var, stats in agg_dict.items():
-        # Skip entries that are not dictionaries (e.g., total_patients)
-        if not isinstance(stats, dict):
-            continue
-        if all(k in stats for k in ["Q1", "median", "Q3", "mean"]):
-            q1 = stats["Q1"]
-            med = stats["median"]
-            q3 = stats["Q3"]
-            IQR = q3 - q1
-            whislo = q1 - 1.5 * IQR
-            whishi = q3 + 1.5 * IQR
-            box_dict = {
-                "label": var,
-                "whislo": round(whislo, 2),
-                "q1": round(q1, 2),
-                "med": round(med, 2),
-                "q3": round(q3, 2),
-                "whishi": round(whishi, 2),
-                "mean": round(stats["mean"], 2),
-                "fliers": []
-            }
-            boxplot_data.append(box_dict)
-            labels.append(var)
+    # Keep only lab variable entries (e.g. skip total_patients) that carry all box statistics
+    items = [
+        (var, stats) for var, stats in agg_dict.items()
+        if isinstance(stats, dict) and {"Q1", "median", "Q3", "mean"} <= stats.keys()
+    ]
+    labels = [var for var, _ in items]
+    q1 = np.array([stats["Q1"] for _, stats in items], dtype=float)
+    med = np.array([stats["median"] for _, stats in items], dtype=float)
+    q3 = np.array([stats["Q3"] for _, stats in items], dtype=float)
+    mean = np.array([stats["mean"] for _, stats in items], dtype=float)
+    IQR = q3 - q1
+    whislo = np.round(q1 - 1.5 * IQR, 2)
+    whishi = np.round(q3 + 1.5 * IQR, 2)
+    boxplot_data = [
+        {"label": label, "whislo": lo, "q1": a, "med": m, "q3": b, "whishi": hi, "mean": mu, "fliers": []}
+        for label, lo, a, m, b, hi, mu in zip(
+            labels, whislo.tolist(), np.round(q1, 2).tolist(), np.round(med, 2).tolist(),
+            np.round(q3, 2).tolist(), whishi.tolist(), np.round(mean, 2).tolist()
+        )
+    ]
     
     # Create a figure and axis.
     fig, ax = plt.subplots(figsize=(10, 6))
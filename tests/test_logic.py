@@ -0,0 +1,135 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from v6_strata_fit_stats_py import logic
+from v6_strata_fit_stats_py._kernels import nan_moments
+
+
+def make_visits():
+    # Six patients with three visits each, stored as text like a raw CSV export, in shuffled
+    # order. The DMARDs never change. Per patient, the visit at 0 months has numeric lab
+    # values, the one at 6 months only an unparsable CRP ("<5") and the one at 12 months
+    # no lab values at all ("" or NaN), so exactly that last visit is invalid and all-missing.
+    rows = []
+    for p in range(6):
+        for visit in (0.0, 6.0, 12.0):
+            row = {
+                "pat_ID": f"P{p}",
+                "Visit_months_from_diagnosis": visit,
+                "Age_diagnosis": 40.0 + p,
+                "Sex": "F" if p % 2 else "M",
+                "RF_positivity": 1,
+                "anti_CCP": 0,
+                "Year_diagnosis": 2000 + p,
+            }
+            for col in logic.DMARD_COLUMNS:
+                row[col] = "MTX"
+            for col in logic.LAB_VARS:
+                if visit == 0.0:
+                    row[col] = str(10 + p)
+                elif visit == 6.0:
+                    row[col] = "<5" if col == "CRP" else ""
+                else:
+                    row[col] = "" if p % 2 == 0 else np.nan
+            rows.append(row)
+    return pd.DataFrame(rows).sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+class TestPartialStatsConsistency(unittest.TestCase):
+
+    def setUp(self):
+        self.df = make_visits()
+
+    def test_unparsable_values_are_not_missing(self):
+        self.assertEqual(logic.check_visit_definition(self.df), {"invalid_visits": 6})
+        self.assertEqual(logic.missing_data_per_visit(self.df)["count_all_missing"], 6)
+
+    def test_hand_computed_values(self):
+        # Three visits over 12 months per patient: 3 / 12 = 0.25 for everyone
+        self.assertEqual(
+            logic.visits_per_time_period(self.df),
+            {
+                "visit_rate_mean": 0.25,
+                "visit_rate_std": 0.0,
+                "visit_rate_median": 0.25,
+                "total_patients": 6,
+            },
+        )
+        # Years 2000..2005: mean 2002.5, sample std sqrt(17.5 / 5) = 1.87, symmetric
+        self.assertEqual(
+            logic.disease_duration_distribution(self.df),
+            {
+                "Year_diagnosis_mean": 2002.5,
+                "Year_diagnosis_std": 1.87,
+                "Year_diagnosis_skewness": 0.0,
+            },
+        )
+
+    def test_composite_matches_standalone_helpers(self):
+        before = self.df.copy()
+        results = logic.compute_partial_stats(self.df)
+        pd.testing.assert_frame_equal(self.df, before)
+
+        self.assertEqual(results["check_visit_definition"], logic.check_visit_definition(self.df))
+        self.assertEqual(results["missing_data_per_visit"], logic.missing_data_per_visit(self.df))
+        self.assertEqual(results["unique_patients_per_center"], logic.unique_patients(self.df))
+        self.assertEqual(results["visits_per_time_period"], logic.visits_per_time_period(self.df))
+        self.assertEqual(
+            results["disease_duration_distribution"], logic.disease_duration_distribution(self.df)
+        )
+
+    def test_requested_blocks_only(self):
+        results = logic.compute_partial_stats(self.df, blocks="missing_data_per_visit")
+        self.assertEqual(list(results), ["missing_data_per_visit"])
+        self.assertEqual(results["missing_data_per_visit"]["count_all_missing"], 6)
+
+    def test_unknown_block_is_rejected(self):
+        with self.assertRaises(ValueError):
+            logic.resolve_blocks(["demographics", "not_a_block"])
+
+
+class TestNanMoments(unittest.TestCase):
+
+    COLUMNS = {
+        "n0": [],
+        "n1": [3.0],
+        "n2": [1.0, 4.0],
+        "n3": [1.0, 2.0, 7.0],
+        "constant": [0.1] * 5,
+        "varied": [2.5, -1.0, 8.25, 3.0, 0.5, 11.0],
+    }
+
+    def frame(self, dtype):
+        length = max(len(v) for v in self.COLUMNS.values())
+        return pd.DataFrame(
+            {k: v + [np.nan] * (length - len(v)) for k, v in self.COLUMNS.items()}
+        ).astype(dtype)
+
+    def assert_matches_pandas(self, df, rtol):
+        mean, std, skew = nan_moments(df.to_numpy())
+        for j, col in enumerate(df.columns):
+            expected = df[col].astype(np.float64)
+            with self.subTest(column=col):
+                np.testing.assert_allclose(mean[j], expected.mean(), rtol=rtol)
+                np.testing.assert_allclose(std[j], expected.std(), rtol=rtol)
+                np.testing.assert_allclose(skew[j], expected.skew(), rtol=rtol, atol=1e-12)
+
+    def test_matches_pandas(self):
+        self.assert_matches_pandas(self.frame(np.float64), rtol=1e-12)
+
+    def test_float32_input(self):
+        self.assert_matches_pandas(self.frame(np.float32), rtol=1e-6)
+
+    def test_one_dimensional_input(self):
+        values = np.array(self.COLUMNS["varied"])
+        mean, std, skew = nan_moments(values)
+        series = pd.Series(values)
+        np.testing.assert_allclose(
+            [mean[0], std[0], skew[0]], [series.mean(), series.std(), series.skew()], rtol=1e-12
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
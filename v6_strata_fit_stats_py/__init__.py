@@ -1,10 +1,16 @@
 import pandas as pd
+from typing import List, Optional, Union
 from vantage6.algorithm.tools.decorators import data
 
-from .logic import compute_partial_stats
+from .logic import compute_partial_stats, resolve_blocks
 from .types import PartialStatsOutput, enforce_output_schema
 
 @data(1)
-@enforce_output_schema(PartialStatsOutput)
-def partial_stats(df: pd.DataFrame):
-    return compute_partial_stats(df)
+def partial_stats(df: pd.DataFrame, blocks: Optional[Union[str, List[str]]] = None):
+    # Checked before the sanitizing decorator, so an invalid request reaches the caller
+    wanted = resolve_blocks(blocks)
+    return _partial_stats(df, blocks=sorted(wanted))
+
+@enforce_output_schema(PartialStatsOutput, skip_dump=True)
+def _partial_stats(df: pd.DataFrame, blocks: List[str]):
+    return compute_partial_stats(df, blocks=blocks)
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+def count_invalid_visits(pat_codes: np.ndarray, dmard_codes: np.ndarray, disease_missing: np.ndarray) -> int:
+    """
+    Counts visits whose DMARD values equal those of the previous visit of the same
+    patient while all disease activity variables are missing.
+
+    All arrays must be aligned and sorted by patient, then visit time:
+      - pat_codes: integer patient codes (negative for a missing pat_ID, never matched).
+      - dmard_codes: 2D integer codes of the DMARD columns, one column per variable;
+        a missing value must have the same code on every row.
+      - disease_missing: per-visit flag, True when all disease activity variables are missing.
+    """
+    same_patient = (pat_codes[1:] == pat_codes[:-1]) & (pat_codes[1:] >= 0)
+    dmard_unchanged = (dmard_codes[1:] == dmard_codes[:-1]).all(axis=1)
+    return int((same_patient & dmard_unchanged & disease_missing[1:]).sum())
+
+
+def nan_moments(values: np.ndarray):
+    """
+    Column-wise mean, sample standard deviation and sample skewness of a 2D array,
+    skipping NaNs, from one shared set of centered values (a 1D array is one column).
+
+    Matches pandas' mean/std/skew: the std is NaN below 2 values, the skewness is the
+    adjusted Fisher-Pearson coefficient, NaN below 3 values and 0 for a constant column.
+    Sums are accumulated in float64, also for float32 input.
+    """
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, values, 0).sum(axis=0, dtype=np.float64) / count
+        centered = np.where(valid, values - mean, 0.0)
+        centered2 = centered ** 2
+        m2 = centered2.sum(axis=0)
+        m3 = (centered2 * centered).sum(axis=0)
+
+        # Zero out floating point noise of (near) constant columns, like pandas does
+        max_abs = np.where(valid, np.abs(values), 0).max(axis=0, initial=0.0)
+        eps = np.finfo(np.float64).eps
+        m2 = np.where(np.abs(m2) <= (eps * max_abs) ** 2 * count, 0.0, m2)
+        m3 = np.where(np.abs(m3) <= (eps * max_abs) ** 3 * count, 0.0, m3)
+
+        std = np.sqrt(m2 / (count - 1))
+        skew = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+    std = np.where(count < 2, np.nan, std)
+    skew = np.where(m2 == 0, 0.0, skew)
+    skew = np.where(count < 3, np.nan, skew)
+    return mean, std, skew
@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from vantage6.algorithm.tools.util import info
 
+from ._kernels import count_invalid_visits, nan_moments
 from .types import (
     enforce_output_schema,
     UniquePatientsOutput,
@@ -13,54 +16,142 @@ from .types import (
     PartialStatsOutput
 )
 
+if TYPE_CHECKING:
+    # Only used in annotations; pandas.api.typing needs pandas 2.1+
+    from pandas.api.typing import DataFrameGroupBy
+
 # Define a privacy threshold: any count below this value is suppressed.
 PRIVACY_THRESHOLD = 5
 
-@enforce_output_schema(UniquePatientsOutput)
-def unique_patients(df: pd.DataFrame):
+# Laboratory / disease activity variables summarised by the lab value statistics.
+LAB_VARS = ["CRP", "ESR", "TJC28", "SJC28", "DAS28", "Pat_global", "Ph_global", "Pain"]
+
+# Numeric columns coerced once in compute_partial_stats; unparsable values become NaN.
+NUMERIC_COLUMNS = LAB_VARS + ["Year_diagnosis", "Age_diagnosis", "Visit_months_from_diagnosis"]
+
+# DMARD-related variables compared between consecutive visits in check_visit_definition.
+DMARD_COLUMNS = ["csDMARD1", "csDMARD2", "csDMARD3", "bDMARD", "tsDMARD", "GC"]
+
+# Identifier and low-cardinality columns converted to category dtype in compute_partial_stats,
+# so grouping, factorizing and value counts run over integer codes instead of raw values.
+CATEGORICAL_COLUMNS = ["pat_ID", "Sex", "RF_positivity", "anti_CCP"] + DMARD_COLUMNS
+
+# Sort invariant: only check_visit_definition depends on the order of the visits. It sorts
+# its own column slice once, stably, by (pat_ID, Visit_months_from_diagnosis); every other
+# helper groups with sort=False or is order independent, so no frame is sorted elsewhere.
+
+# Output keys of compute_partial_stats, each of which can be requested separately.
+PARTIAL_STATS_BLOCKS = (
+    "unique_patients_per_center",
+    "check_visit_definition",
+    "visits_per_time_period",
+    "missing_data_per_visit",
+    "demographics",
+    "disease_duration_distribution",
+    "laboratory_values_overall",
+    "laboratory_values_grouped_by_pat_id",
+)
+
+# Columns each output block needs; compute_partial_stats skips a block when any is absent.
+PARTIAL_STATS_BLOCK_COLUMNS = {
+    "unique_patients_per_center": ["pat_ID"],
+    "check_visit_definition": ["pat_ID", "Visit_months_from_diagnosis"],
+    "visits_per_time_period": ["pat_ID", "Visit_months_from_diagnosis"],
+    "missing_data_per_visit": LAB_VARS,
+    "demographics": ["Age_diagnosis", "Sex", "RF_positivity", "anti_CCP"],
+    "disease_duration_distribution": ["pat_ID", "Year_diagnosis"],
+    "laboratory_values_overall": LAB_VARS,
+    "laboratory_values_grouped_by_pat_id": ["pat_ID"] + LAB_VARS,
+}
+
+def all_values_missing(block: pd.DataFrame) -> np.ndarray:
+    """
+    Flags the rows of block in which every value is missing, i.e. NaN/None or, in text
+    columns, an empty string. Values that are present but not numeric (e.g. "<5") count
+    as present, so this must run on the raw values, before any numeric coercion.
+    """
+    # An owned copy: under copy-on-write to_numpy() may return a read-only view
+    missing = block.isna().to_numpy(copy=True)
+    # Only text columns can hold "" placeholders; numeric columns skip the string comparison.
+    # Nullable string columns compare to <NA> for missing values, which is already flagged.
+    for j, col in enumerate(block.columns):
+        if not pd.api.types.is_numeric_dtype(block[col]):
+            missing[:, j] |= block[col].eq("").to_numpy(dtype=bool, na_value=False)
+    return missing.all(axis=1)
+
+@enforce_output_schema(UniquePatientsOutput, skip_dump=True)
+def unique_patients(df: pd.DataFrame, n_patients: Optional[int] = None):
     """
     1. Unique Patients Per Center:
        Count the number of unique patient IDs.
        If the count is below the privacy threshold, report "<{threshold}".
+       An already computed patient count of df can be passed in as n_patients.
     """
-    count = int(df["pat_ID"].nunique())
+    count = n_patients if n_patients is not None else int(df["pat_ID"].nunique())
     if count < PRIVACY_THRESHOLD:
         return f"<{PRIVACY_THRESHOLD}"
     return {"unique_patients": count}
 
-@enforce_output_schema(VisitDefinitionOutput)
-def check_visit_definition(df: pd.DataFrame):
+@enforce_output_schema(VisitDefinitionOutput, skip_dump=True)
+def check_visit_definition(
+    df: pd.DataFrame,
+    disease_missing: Optional[np.ndarray] = None,
+):
     """
     2. Check Visit Definition:
        For each patient (grouped by pat_ID), sort visits by 'Visit_months_from_diagnosis'.
        For each visit (after the first), compare DMARD-related variables to the previous visit 
        and check if all disease activity variables are missing.
+       The per-row all_values_missing flags of the disease activity columns, computed on
+       the raw values and aligned with df, can be passed in as disease_missing.
        
        Returns a dictionary with the total count of invalid visits.
        (Note: The behavior when values are None is left as a TODO for clinical input.)
     """
-    dmard_cols = ["csDMARD1", "csDMARD2", "csDMARD3", "bDMARD", "tsDMARD", "GC"]
+    dmard_cols = DMARD_COLUMNS
     disease_activity_cols = ["DAS28", "ESR", "CRP", "TJC28", "SJC28", "Pat_global", "Ph_global", "Pain"]
-    invalid_count = 0
-
-    for pat_id, group in df.groupby("pat_ID"):
-        group = group.sort_values("Visit_months_from_diagnosis").reset_index(drop=True)
-        for i in range(1, len(group)):
-            current = group.iloc[i]
-            previous = group.iloc[i - 1]
-            # For DMARD columns, treat both values missing as "unchanged"
-            dmard_unchanged = all(
-                (pd.isna(current[col]) and pd.isna(previous[col])) or (current[col] == previous[col])
-                for col in dmard_cols if col in group.columns
-            )
-            disease_missing = all(pd.isna(current[col]) or current[col] == ""
-                                  for col in disease_activity_cols if col in group.columns)
-            if dmard_unchanged and disease_missing:
-                invalid_count += 1
+    present_dmard = [col for col in dmard_cols if col in df.columns]
+    present_disease = [col for col in disease_activity_cols if col in df.columns]
+    if disease_missing is None:
+        disease_missing = all_values_missing(df[present_disease])
+
+    # Sort once (stable) so every visit directly follows its predecessor of the same patient;
+    # the sort is taken by position so the missing flags can follow the same order
+    sort_cols = ["pat_ID", "Visit_months_from_diagnosis"]
+    df_sorted = df[sort_cols + present_dmard]
+    order = (
+        df_sorted[sort_cols].reset_index(drop=True)
+          .sort_values(sort_cols, kind="mergesort").index.to_numpy()
+    )
+    df_sorted = df_sorted.take(order)
+    disease_missing = disease_missing[order]
+    pat_codes = pd.factorize(df_sorted["pat_ID"])[0]
+
+    # Encode DMARD values as integer codes; missing values share code -1,
+    # so both values missing counts as "unchanged". The codes use the narrowest integer
+    # type that holds them (int8 for the usual handful of values), so the comparison
+    # streams as few bytes as possible.
+    codes = []
+    for col in present_dmard:
+        column = df_sorted[col]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Category codes already come in the narrowest type
+            codes.append(column.cat.codes.to_numpy())
+        else:
+            col_codes, uniques = pd.factorize(column)
+            codes.append(col_codes.astype(np.min_scalar_type(-len(uniques) - 1)))
+    code_dtype = np.result_type(np.int8, *(col_codes.dtype for col_codes in codes))
+    dmard_codes = np.empty((len(df_sorted), len(present_dmard)), dtype=code_dtype)
+    for j, col_codes in enumerate(codes):
+        dmard_codes[:, j] = col_codes
+
+    invalid_count = count_invalid_visits(pat_codes, dmard_codes, disease_missing)
     return {"invalid_visits": invalid_count}
 
 @enforce_output_schema(VisitsPerTimePeriodOutput)
-def visits_per_time_period(df: pd.DataFrame):
+def visits_per_time_period(
+    df: pd.DataFrame, grouped: Optional["DataFrameGroupBy"] = None, n_patients: Optional[int] = None
+):
     """
     3. Visits Per Time Period:
        For each patient, calculate:
@@ -70,27 +161,30 @@ def visits_per_time_period(df: pd.DataFrame):
        
        Returns a dictionary of overall summary statistics (mean, std, median) of the visit rate,
        along with the total patient count.
+       An existing pat_ID grouping of df can be passed in as grouped to avoid regrouping,
+       and its patient count as n_patients.
     """
-    results = []
-    for _, group in df.groupby("pat_ID"):
-        group = group.sort_values("Visit_months_from_diagnosis")
-        visits_count = len(group)
-        min_visit = group["Visit_months_from_diagnosis"].min()
-        max_visit = group["Visit_months_from_diagnosis"].max()
-        total_follow_up = max_visit - min_visit if visits_count > 1 else np.nan
-        rate = visits_count / total_follow_up if total_follow_up and total_follow_up > 0 else np.nan
-        results.append(rate)
-    rates = pd.Series(results).dropna()
+    if grouped is None:
+        grouped = df.groupby("pat_ID", sort=False, observed=True)
+    per_patient = grouped["Visit_months_from_diagnosis"].agg(
+        visits_count="size", min_visit="min", max_visit="max"
+    )
+    total_follow_up = (per_patient["max_visit"] - per_patient["min_visit"]).where(per_patient["visits_count"] > 1)
+    rates = (per_patient["visits_count"] / total_follow_up).where(total_follow_up > 0).dropna()
     overall_stats = {
         "visit_rate_mean": round(rates.mean(), 3) if not rates.empty else None,
         "visit_rate_std": round(rates.std(), 3) if not rates.empty else None,
         "visit_rate_median": round(rates.median(), 3) if not rates.empty else None,
-        "total_patients": int(df["pat_ID"].nunique())
+        # Patients with a non-missing pat_ID, counted from the grouping
+        "total_patients": n_patients if n_patients is not None else grouped.ngroups
     }
     return overall_stats
 
 @enforce_output_schema(MissingDataPerVisitOutput)
-def missing_data_per_visit(df: pd.DataFrame):
+def missing_data_per_visit(
+    df: pd.DataFrame,
+    all_missing: Optional[np.ndarray] = None,
+):
     """
     4. Missing Data Per Feature:
        Check each visit to see if ALL key clinical/lab variables are missing.
@@ -99,9 +193,12 @@ def missing_data_per_visit(df: pd.DataFrame):
          - Count of visits with all missing values.
          - Total number of visits.
          - Percentage of such visits.
+       The per-row all_values_missing flags of these variables, computed on the raw
+       values and aligned with df, can be passed in as all_missing.
     """
     cols = ["DAS28", "ESR", "CRP", "TJC28", "SJC28", "Pat_global", "Ph_global", "Pain"]
-    all_missing = df[cols].apply(lambda row: all(pd.isna(x) or x == "" for x in row), axis=1)
+    if all_missing is None:
+        all_missing = all_values_missing(df[cols])
     count_missing = all_missing.sum()
     total = len(df)
     percent_missing = round((count_missing / total) * 100, 2) if total > 0 else 0
@@ -111,23 +208,29 @@ def missing_data_per_visit(df: pd.DataFrame):
         "percent_all_missing": percent_missing
     }
 
-def safe_counts_and_proportions_groupwise(counts: Dict[Any, int], threshold=PRIVACY_THRESHOLD):
+def safe_counts_and_proportions_groupwise(counts: Union[pd.Series, Dict[Any, int]], threshold=PRIVACY_THRESHOLD):
     """
     Masks *all* counts and proportions if any group has a count below the threshold.
+    Counts are given per group, e.g. the Series returned by value_counts.
 
     Returns:
         safe_counts: Dict[Any, Union[int, str]]
         safe_proportions: Dict[Any, Union[float, str]]
     """
-    if any(v < threshold for v in counts.values()):
+    if not isinstance(counts, pd.Series):
+        counts = pd.Series(counts, dtype="int64")
+    values = counts.to_numpy()
+    if (values < threshold).any():
         return (
-            {k: f"<{threshold}" for k in counts},
-            {k: "masked" for k in counts}
+            {k: f"<{threshold}" for k in counts.index},
+            {k: "masked" for k in counts.index}
         )
 
-    total = sum(counts.values())
-    safe_counts = {k: v for k, v in counts.items()}
-    safe_proportions = {k: round(v / total, 3) if total > 0 else None for k, v in counts.items()}
+    # No group is below the threshold here, so the total is positive unless there are no groups
+    safe_counts = counts.to_dict()
+    # Rounded per value as Python floats; a vectorized round(3) can differ on ties (39/80)
+    total = int(values.sum())
+    safe_proportions = {k: round(v / total, 3) for k, v in safe_counts.items()}
     return safe_counts, safe_proportions
 
 
@@ -145,15 +248,18 @@ def demographics_stats(df: pd.DataFrame):
     # Continuous variable: Age_diagnosis
     age_column_name = "Age_diagnosis"
     if age_column_name in df.columns:
-        results["Age_mean"] = round(df[age_column_name].mean(), 2)
-        results["Age_std"] = round(df[age_column_name].std(), 2)
+        age_stats = df[age_column_name].agg(["mean", "std"])
+        results["Age_mean"] = round(age_stats["mean"], 2)
+        results["Age_std"] = round(age_stats["std"], 2)
     else:
         raise KeyError(f'Column "{age_column_name}" is not present in the dataset - review the data schema adherence!')
     
-    # Categorical variables
-    for var in ["Sex", "RF_positivity", "anti_CCP"]:
-        if var in df.columns:
-            counts = df[var].value_counts(dropna=False).to_dict()
+    # Categorical variables, counted over category codes rather than hashed raw values
+    categorical_vars = ["Sex", "RF_positivity", "anti_CCP"]
+    categorical_df = df[[var for var in categorical_vars if var in df.columns]].astype("category")
+    for var in categorical_vars:
+        if var in categorical_df.columns:
+            counts = categorical_df[var].value_counts(dropna=False)
             safe_counts, safe_proportions = safe_counts_and_proportions_groupwise(counts)
             results[f"{var}_counts"] = safe_counts
             results[f"{var}_proportions"] = safe_proportions
@@ -172,18 +278,19 @@ def disease_duration_distribution(df: pd.DataFrame):
     year_column = "Year_diagnosis"
     groupping_column = "pat_ID"
     if year_column in df.columns and groupping_column in df.columns:
-        # Group by patient and take the first non-null value
-        patient_level = (
-            df.dropna(subset=[year_column])
-              .groupby(groupping_column)[year_column]
-              .first()
-              .apply(pd.to_numeric, errors="coerce")
+        # Keep the first non-null value per patient (a plain dedupe, no group index needed)
+        patient_level = coerce_numeric_columns(
+            df[[groupping_column, year_column]]
               .dropna()
-        )
+              .drop_duplicates(groupping_column, keep="first"),
+            [year_column]
+        )[year_column]
+        # Moments straight from the raw array (NaNs left by the coercion are skipped)
+        means, stds, skews = nan_moments(patient_level.to_numpy(dtype=np.float64, na_value=np.nan))
         return {
-            f"{year_column}_mean": round(patient_level.mean(), 2),
-            f"{year_column}_std": round(patient_level.std(), 2),
-            f"{year_column}_skewness": round(patient_level.skew(), 2)
+            f"{year_column}_mean": round(means[0], 2),
+            f"{year_column}_std": round(stds[0], 2),
+            f"{year_column}_skewness": round(skews[0], 2)
         }
     else:
         error_message = (
@@ -193,75 +300,123 @@ def disease_duration_distribution(df: pd.DataFrame):
         raise KeyError(error_message)
 
 
-def lab_values_stats_overall(df: pd.DataFrame):
+def lab_values_stats_overall(
+    df: pd.DataFrame, lab_block: Optional[pd.DataFrame] = None
+):
     """
     7a. Laboratory Values (Overall):
        Compute overall descriptive statistics for lab variables.
+       The float32 lab block of df (see compute_partial_stats) can be passed in as lab_block.
     """
-    lab_vars = ["CRP", "ESR", "TJC28", "SJC28", "DAS28", "Pat_global", "Ph_global", "Pain"]
-    results = {}
-    missing_columns = []
-    for var in lab_vars:
-        if var in df.columns:
-            series = pd.to_numeric(df[var], errors='coerce')
-            mean_val = series.mean()
-            std_val = series.std()
-            skewness_val = series.skew()
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = series[(series < lower_bound) | (series > upper_bound)].tolist()
-            results[var] = {
-                "mean": round(mean_val, 2),
-                "std": round(std_val, 2),
-                "skewness": round(skewness_val, 2),
-                "outlier_count": len(outliers)
-            }
-        else:
-            missing_columns.append(var)
+    present = [var for var in LAB_VARS if var in df.columns]
+    missing_columns = [var for var in LAB_VARS if var not in df.columns]
     if missing_columns:
         error_message = (
             f'Columns {missing_columns} are '
             'not present in the dataset - review the data schema adherence!'
         )
         raise KeyError(error_message)
+
+    # float32 is ample for values reported to 2 decimals and halves the memory
+    # traffic; the moments are accumulated in float64 regardless.
+    # All statistics are computed column-wise over the whole block (NaNs are skipped).
+    if lab_block is not None:
+        block = lab_block[present]
+    else:
+        block = coerce_numeric_columns(df[present], present).astype(np.float32)
+    # Mean, std and skewness share one centering pass instead of three pandas reductions
+    means, stds, skews = nan_moments(block.to_numpy())
+    quartiles = block.quantile([0.25, 0.75])
+    Q1, Q3 = quartiles.loc[0.25], quartiles.loc[0.75]
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    outlier_counts = (block.lt(lower_bound, axis=1) | block.gt(upper_bound, axis=1)).sum()
+
+    results = {}
+    for j, var in enumerate(present):
+        results[var] = {
+            "mean": round(float(means[j]), 2),
+            "std": round(float(stds[j]), 2),
+            "skewness": round(float(skews[j]), 2),
+            "outlier_count": int(outlier_counts[var])
+        }
     return results
 
-def lab_values_stats_aggregated(df: pd.DataFrame):
+def lab_values_stats_aggregated(
+    df: pd.DataFrame, grouped: Optional["DataFrameGroupBy"] = None
+):
     """
     7b. Laboratory Values (Aggregated):
        Aggregate lab values by patient and summarize those aggregates.
+       An existing pat_ID grouping of df can be passed in as grouped to avoid regrouping.
     """
     if "pat_ID" not in df.columns:
         raise ValueError("Grouping requested but 'pat_ID' column not found.")
-    lab_vars = ["CRP", "ESR", "TJC28", "SJC28", "DAS28", "Pat_global", "Ph_global", "Pain"]
-    missing_columns = []
-    grouped = df.groupby("pat_ID")
-    results = {}
-    for var in lab_vars:
-        if var in df.columns:
-            means = grouped[var].mean().dropna()
-            results[var] = {
-                "mean": round(means.mean(), 2),
-                "std": round(means.std(), 2),
-                "median": round(means.median(), 2),
-                "Q1": round(means.quantile(0.25), 2),
-                "Q3": round(means.quantile(0.75), 2)
-            }
-        else:
-            missing_columns.append(var)
+    present = [var for var in LAB_VARS if var in df.columns]
+    missing_columns = [var for var in LAB_VARS if var not in df.columns]
     if missing_columns:
         error_message = (
             f'Columns {missing_columns} are '
             'not present in the dataset - review the data schema adherence!'
         )
         raise KeyError(error_message)
+
+    # One grouped pass over the data for all lab variables; the summaries then run
+    # on the small per-patient frame (describe skips NaN means, like dropna did).
+    numeric_df = coerce_numeric_columns(df, present)
+    if numeric_df is not df:
+        # The lab columns changed, so a grouping of the original frame cannot be reused
+        df, grouped = numeric_df, None
+    if grouped is None:
+        grouped = df.groupby("pat_ID", sort=False, observed=True)
+    per_patient = grouped[present].mean()
+    summary = per_patient.describe(percentiles=[0.25, 0.5, 0.75])
+    results = {}
+    for var in present:
+        results[var] = {
+            "mean": float(round(summary.at["mean", var], 2)),
+            "std": float(round(summary.at["std", var], 2)),
+            "median": float(round(summary.at["50%", var], 2)),
+            "Q1": float(round(summary.at["25%", var], 2)),
+            "Q3": float(round(summary.at["75%", var], 2))
+        }
     return results
 
-@enforce_output_schema(PartialStatsOutput)
-def compute_partial_stats(df: pd.DataFrame):
+def coerce_numeric_columns(df: pd.DataFrame, columns):
+    """
+    Returns the dataset with the given columns (where present) converted to numeric.
+    Values that cannot be parsed become NaN. Columns that already have a numeric dtype
+    are left as they are; if no column needs converting, df itself is returned.
+    """
+    to_convert = [
+        col for col in columns
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+    ]
+    if not to_convert:
+        return df
+    numeric_df = df.copy()
+    numeric_df[to_convert] = df[to_convert].apply(pd.to_numeric, errors="coerce")
+    return numeric_df
+
+def resolve_blocks(blocks: Optional[Union[str, List[str]]] = None) -> set:
+    """
+    Returns the set of output blocks to compute for the `blocks` argument of
+    compute_partial_stats: every block for None, or the given names (a single name may
+    be passed as a plain string). Raises ValueError for unknown block names.
+    """
+    if blocks is None:
+        return set(PARTIAL_STATS_BLOCKS)
+    if isinstance(blocks, str):
+        blocks = [blocks]
+    wanted = set(blocks)
+    unknown_blocks = wanted.difference(PARTIAL_STATS_BLOCKS)
+    if unknown_blocks:
+        raise ValueError(f"Unknown blocks requested: {sorted(unknown_blocks)}; expected any of {list(PARTIAL_STATS_BLOCKS)}.")
+    return wanted
+
+@enforce_output_schema(PartialStatsOutput, skip_dump=True)
+def compute_partial_stats(df: pd.DataFrame, blocks: Optional[Union[str, List[str]]] = None):
     """
     Aggregates various statistics for the dataset while preserving privacy.
     Calls individual functions for:
@@ -272,27 +427,81 @@ def compute_partial_stats(df: pd.DataFrame):
       5. Demographics
       6. Disease Duration Distribution
       7. Laboratory Values (Overall and Aggregated)
+    
+    `blocks` optionally restricts the computation to a subset of the output keys
+    (see PARTIAL_STATS_BLOCKS and resolve_blocks); by default every block is computed.
+    Blocks whose columns (see PARTIAL_STATS_BLOCK_COLUMNS) are absent from df are skipped,
+    and only the preparation the remaining blocks need is done.
       
     Returns a dictionary with all computed results.
     """
-    unique = unique_patients(df)
-    visit_def = check_visit_definition(df)
-    visits_overall = visits_per_time_period(df)
-    missing_data = missing_data_per_visit(df)
-    demographics = demographics_stats(df)
-    duration = disease_duration_distribution(df)
-    lab_overall = lab_values_stats_overall(df)
-    lab_grouped = lab_values_stats_aggregated(df)
-
-    results = {
-        "unique_patients_per_center": unique,
-        "check_visit_definition": visit_def,
-        "visits_per_time_period": visits_overall,
-        "missing_data_per_visit": missing_data,
-        "demographics": demographics,
-        "disease_duration_distribution": duration,
-        "laboratory_values_overall": lab_overall,
-        "laboratory_values_grouped_by_pat_id": lab_grouped
+    wanted = resolve_blocks(blocks)
+
+    # Probe the columns once and leave out blocks that cannot be computed on this dataset
+    columns = frozenset(df.columns)
+    skipped_blocks = {
+        block for block in wanted if not columns.issuperset(PARTIAL_STATS_BLOCK_COLUMNS[block])
     }
+    if skipped_blocks:
+        info(f"Skipping blocks with columns missing from the dataset: {sorted(skipped_blocks)}.")
+        wanted -= skipped_blocks
+
+    # Each shared preparation step below only runs when a wanted block reads its result.
+    used_columns = set().union(*(PARTIAL_STATS_BLOCK_COLUMNS[block] for block in wanted))
+    if "check_visit_definition" in wanted:
+        used_columns.update(DMARD_COLUMNS)
+
+    # Missingness is taken from the raw values before coercion: a lab value that was
+    # recorded but cannot be parsed (e.g. "<5") becomes NaN below, yet it is not missing.
+    lab_missing = None
+    if wanted & {"check_visit_definition", "missing_data_per_visit"}:
+        lab_missing = all_values_missing(df[[var for var in LAB_VARS if var in columns]])
+
+    # Coerce the numeric columns once instead of in every helper that reads them (this
+    # copies only if a column actually needs converting), so the visit times also sort
+    # numerically. The categorical columns are converted on a new frame (assign), so the
+    # caller's frame is never touched. Row order is kept, so lab_missing stays aligned.
+    df = coerce_numeric_columns(df, [col for col in NUMERIC_COLUMNS if col in used_columns])
+    to_categorize = [col for col in CATEGORICAL_COLUMNS if col in used_columns and col in columns]
+    if to_categorize:
+        df = df.assign(**{col: df[col].astype("category") for col in to_categorize})
+
+    # The grouping is built, and its group index computed (ngroups), here on the main
+    # thread: pandas fills those caches lazily on first use and does not promise that is
+    # thread-safe, so the worker threads below must only read an already resolved grouping.
+    grouped = n_patients = None
+    if wanted & {"unique_patients_per_center", "visits_per_time_period", "laboratory_values_grouped_by_pat_id"}:
+        grouped = df.groupby("pat_ID", sort=False, observed=True)
+        n_patients = grouped.ngroups
+    # Slice the (already numeric) lab columns out once as a float32 block for the overall
+    # lab statistics.
+    lab_block = None
+    if "laboratory_values_overall" in wanted:
+        lab_block = df[LAB_VARS].astype(np.float32)
+
+    # Every block only reads the shared frame, grouping and lab block and spends most of its
+    # time in pandas/NumPy code that releases the GIL, so all of them run in worker threads.
+    block_calls = {
+        "unique_patients_per_center": (unique_patients, {"n_patients": n_patients}),
+        "check_visit_definition": (
+            check_visit_definition, {"disease_missing": lab_missing}
+        ),
+        "visits_per_time_period": (
+            visits_per_time_period, {"grouped": grouped, "n_patients": n_patients}
+        ),
+        "missing_data_per_visit": (missing_data_per_visit, {"all_missing": lab_missing}),
+        "demographics": (demographics_stats, {}),
+        "disease_duration_distribution": (disease_duration_distribution, {}),
+        "laboratory_values_overall": (lab_values_stats_overall, {"lab_block": lab_block}),
+        "laboratory_values_grouped_by_pat_id": (
+            lab_values_stats_aggregated, {"grouped": grouped}
+        ),
+    }
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            key: executor.submit(func, df, **kwargs)
+            for key, (func, kwargs) in block_calls.items() if key in wanted
+        }
+        results = {key: future.result() for key, future in futures.items()}
 
     return results
@@ -3,10 +3,17 @@ from pydantic import BaseModel, ValidationError, Field
 from typing import Dict, Union, Optional, Any
 from vantage6.algorithm.tools.util import info
 
-def enforce_output_schema(model: BaseModel):
+def _hidden_error_message(prefix: str, error: Exception) -> str:
+    # Only the error type is reported; the message may contain node data
+    return f"{prefix} Error type is '{type(error)}', error message is hidden for security reasons."
+
+def enforce_output_schema(model: BaseModel, skip_dump: bool = False):
     """
     Decorator to validate output against a Pydantic model.
     Sanitizes validation errors to avoid leaking sensitive node data.
+    With skip_dump=True a validated dict is returned as is instead of being dumped from
+    the model; only use it where the output already holds plain Python values that
+    validation would not coerce.
     """
     def decorator(func):
         @wraps(func)
@@ -15,16 +22,17 @@ def enforce_output_schema(model: BaseModel):
             try:
                 result = func(*args, **kwargs)
             except Exception as e:
-                safe_error_message = (
-                    f"During the run of function '{func.__name__}'. "
-                    f"Error type is '{type(e)}', error message is hidden for security reasons."
-                )
-                info(safe_error_message)
+                info(_hidden_error_message(f"During the run of function '{func.__name__}'.", e))
                 return
             info(f"Finished computation in function: '{func.__name__}'.")
+
+            # Validate and (unless skipped) serialize the output in one guarded step
             try:
                 validated = model.model_validate(result)
                 info(f"Validated output of the function '{func.__name__}' adherence to model '{model.__name__}'.")
+                if skip_dump and isinstance(result, dict):
+                    return result
+                return validated.model_dump(exclude_unset=True)
             except ValidationError as e:
 
                 # Extract field name only (first in the error array) and no value
@@ -42,28 +50,13 @@ def enforce_output_schema(model: BaseModel):
                 )
 
                 raise ValueError(safe_error_message) from None
-            
-            # Handle unexpected exceptions here
-            except Exception as e:
-                safe_error_message = (
-                    f"Validation of model '{model.__name__}' failed unexpectedly "
-                    f"during the run of function '{func.__name__}'. "
-                    f"Error type is '{type(e)}', error message is hidden for security reasons."
-                )
-                raise Exception(safe_error_message) from None
 
-            # Handle potential serialization errors
-            try:
-                dumped_validated_results =  validated.model_dump()
-                return dumped_validated_results
+            # Handle unexpected validation or serialization errors here
             except Exception as e:
-                safe_error_message = (
-                    f"Data dump for model '{model.__name__}' failed unexpectedly "
-                    f"during the run of function '{func.__name__}'. "
-                    f"Error type is '{type(e)}', error message is hidden for security reasons."
-                )
-                raise Exception(safe_error_message) from None
-
+                raise Exception(_hidden_error_message(
+                    f"Validation or data dump of model '{model.__name__}' failed unexpectedly "
+                    f"during the run of function '{func.__name__}'.", e
+                )) from None
 
         return wrapper
 
@@ -142,13 +135,16 @@ class LabValueAggregatedOutput(BaseModel):
     Pain: LabValueAggregated
 
 
-# Finally, a composite model for the overall algorithm output
+# Finally, a composite model for the overall algorithm output.
+# Blocks that were not requested, or whose columns are missing, are left unset (and dropped
+# from the dump); the None default is not validated, so a computed block that failed still
+# fails validation.
 class PartialStatsOutput(BaseModel):
-    unique_patients_per_center: UniquePatientsOutput
-    check_visit_definition: VisitDefinitionOutput
-    visits_per_time_period: VisitsPerTimePeriodOutput
-    missing_data_per_visit: MissingDataPerVisitOutput
-    demographics: DemographicsOutput
-    disease_duration_distribution: DiseaseDurationDistributionOutput
-    laboratory_values_overall: LabValueOverallOutput
-    laboratory_values_grouped_by_pat_id: LabValueAggregatedOutput
\ No newline at end of file
+    unique_patients_per_center: UniquePatientsOutput = None
+    check_visit_definition: VisitDefinitionOutput = None
+    visits_per_time_period: VisitsPerTimePeriodOutput = None
+    missing_data_per_visit: MissingDataPerVisitOutput = None
+    demographics: DemographicsOutput = None
+    disease_duration_distribution: DiseaseDurationDistributionOutput = None
+    laboratory_values_overall: LabValueOverallOutput = None
+    laboratory_values_grouped_by_pat_id: LabValueAggregatedOutput = None
\ No newline at end of file